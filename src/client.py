@@ -2,32 +2,308 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from types import TracebackType
-from typing import Any
 
 import httpx
+from pydantic_core import from_json
 
-from src.models import Character
+from src.models import CHARACTER_LIST_ADAPTER, Character
 
 BASE_URL = "https://rickandmortyapi.com/api"
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_HTTP2 = True
+DEFAULT_CACHE_MAX = 512
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+_BACKOFF_MULTIPLIER = 0.1
+_BACKOFF_MAX = 10.0
+_SERVER_DELAY_MAX = 60.0
+_NOT_FOUND_ERROR = "Character not found"
+_JSON_STRUCTURAL = re.compile(rb'[\[\]{}"\\]')
+_JSON_CLOSERS = {ord("["): ord("]"), ord("{"): ord("}")}
+_DEFAULT_CLIENTS: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_default_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop.
+
+    The client is created lazily with DEFAULT_TIMEOUT, DEFAULT_HTTP2 and
+    DEFAULT_LIMITS, and is reused by every caller on the same loop so they
+    share one connection pool. Pass it to ``RickAndMortyClient(client=...)``.
+
+    Call close_default_client() before the loop shuts down. Otherwise the
+    loop, the client and its open sockets stay referenced and leak: the
+    next call only drops entries of closed loops, without closing their
+    connections cleanly.
+
+    Raises:
+        RuntimeError: If called without a running event loop.
+    """
+    for stale_loop in [loop for loop in _DEFAULT_CLIENTS if loop.is_closed()]:
+        del _DEFAULT_CLIENTS[stale_loop]
+    loop = asyncio.get_running_loop()
+    client = _DEFAULT_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            http2=DEFAULT_HTTP2,
+            limits=DEFAULT_LIMITS,
+        )
+        _DEFAULT_CLIENTS[loop] = client
+    return client
+
+
+async def close_default_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any.
+
+    Call it before the loop shuts down, e.g. at the end of ``main()``.
+    """
+    client = _DEFAULT_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def response_text(response: httpx.Response) -> str:
+    """Decode a response body to text without blocking the event loop.
+
+    The client only ever parses ``response.content``; charset detection and
+    decoding run in a worker thread here. Useful for logging the body of an
+    ``httpx.HTTPStatusError``. The body must already be read.
+    """
+    return await asyncio.to_thread(lambda: response.text)
+
+
+def _is_character_not_found(response: httpx.Response) -> bool:
+    """Return whether a response is the API's answer for an unknown character.
+
+    Only a 404 whose body is ``{"error": "Character not found"}`` counts, so
+    a 404 from a wrong ``base_url`` or a proxy is not mistaken for one.
+    """
+    if response.status_code != httpx.codes.NOT_FOUND:
+        return False
+    try:
+        body = from_json(response.content)
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("error") == _NOT_FOUND_ERROR
+
+
+def _server_retry_delay(headers: httpx.Headers) -> float | None:
+    """Return the delay requested by ``Retry-After`` or ``X-RateLimit-Reset``.
+
+    The result is negative when the requested time is already in the past.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if retry_at.tzinfo is None:
+                # "-0000" dates carry no zone; RFC 5322 reads them as UTC.
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return (retry_at - datetime.now(timezone.utc)).total_seconds()
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        try:
+            return float(reset) - time.time()
+        except ValueError:
+            pass
+    return None
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Return how long to wait before retrying after the given attempt.
+
+    A positive server-requested delay wins, capped at 60 seconds. Otherwise
+    the delay is drawn uniformly from ``[0, min(10, 0.1 * 2**attempt)]``.
+    """
+    if response is not None:
+        server_delay = _server_retry_delay(response.headers)
+        if server_delay is not None and server_delay > 0:
+            return min(server_delay, _SERVER_DELAY_MAX)
+    ceiling = min(_BACKOFF_MAX, _BACKOFF_MULTIPLIER * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+class _JSONObjectSplitter:
+    """Incrementally cut JSON bytes into the objects held by arrays.
+
+    Emits every object whose parent is an array and that is not nested in
+    another emitted object: each element of ``[{...}, {...}]``, or of the
+    ``results`` list in ``{"info": {...}, "results": [{...}]}``. A top-level
+    object holding no such objects, such as a single-character response, is
+    kept whole in ``bare_object`` instead.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._stack = bytearray()
+        self._in_string = False
+        self._item_start = -1
+        self._item_depth = 0
+        self._holding_top_level = False
+        self.bare_object: bytes | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk and return the objects it completed."""
+        buffer = self._buffer
+        buffer += chunk
+        items: list[bytes] = []
+        position = self._scanned
+        while match := _JSON_STRUCTURAL.search(buffer, position):
+            index = match.start()
+            byte = buffer[index]
+            position = index + 1
+            if self._in_string:
+                if byte == ord("\\"):
+                    if position == len(buffer):
+                        # Wait for the escaped byte before moving on.
+                        position = index
+                        break
+                    position += 1
+                elif byte == ord('"'):
+                    self._in_string = False
+            elif byte == ord('"'):
+                self._in_string = True
+            elif byte in b"[{":
+                self._open(byte, index)
+            elif byte in b"]}":
+                item = self._close(byte, index)
+                if item is not None:
+                    items.append(item)
+        else:
+            position = len(buffer)
+        # Drop bytes that no pending object needs any more.
+        keep_from = self._item_start if self._item_start >= 0 else position
+        del buffer[:keep_from]
+        self._scanned = position - keep_from
+        self._item_start = min(self._item_start, 0)
+        return items
+
+    def _open(self, byte: int, index: int) -> None:
+        """Track an opening bracket, starting an object to emit if needed."""
+        if byte == ord("{") and not self._stack:
+            # Hold a top-level object until it turns out to be a listing,
+            # i.e. until an object inside an array shows up.
+            self._item_start = index
+            self._item_depth = 0
+            self._holding_top_level = True
+        elif (
+            byte == ord("{")
+            and (self._item_start < 0 or self._holding_top_level)
+            and self._stack[-1:] == b"["
+        ):
+            self._item_start = index
+            self._item_depth = len(self._stack)
+            self._holding_top_level = False
+        self._stack.append(byte)
+
+    def _close(self, byte: int, index: int) -> bytes | None:
+        """Track a closing bracket and return the array item it completes."""
+        if not self._stack:
+            msg = f"Malformed JSON: unexpected {chr(byte)!r} at top level"
+            raise ValueError(msg)
+        if _JSON_CLOSERS[self._stack.pop()] != byte:
+            msg = f"Malformed JSON: mismatched {chr(byte)!r}"
+            raise ValueError(msg)
+        if self._item_start < 0 or len(self._stack) != self._item_depth:
+            return None
+        item = bytes(self._buffer[self._item_start : index + 1])
+        self._item_start = -1
+        if self._holding_top_level:
+            self.bare_object = item
+            self._holding_top_level = False
+            return None
+        return item
 
 
 class RickAndMortyClient:
     """Async client for interacting with the Rick and Morty API."""
 
-    def __init__(self, timeout: float = 10.0, base_url: str = BASE_URL) -> None:
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        base_url: str = BASE_URL,
+        *,
+        http2: bool = DEFAULT_HTTP2,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        validate: bool = True,
+        cache_max: int = DEFAULT_CACHE_MAX,
+        client: httpx.AsyncClient | None = None,
+        max_attempts: int = 5,
+    ) -> None:
         """Initialize the client.
 
         Args:
-            timeout: Request timeout in seconds. Defaults to 10.0.
+            timeout: Request timeout in seconds. Defaults to DEFAULT_TIMEOUT.
             base_url: Base URL for the API. Defaults to BASE_URL.
+            http2: Whether to negotiate HTTP/2, which multiplexes concurrent
+                requests over a single connection. Requires the ``h2`` package
+                (installed via ``httpx[http2]``). Defaults to DEFAULT_HTTP2.
+            limits: Connection pool limits. Defaults to DEFAULT_LIMITS.
+            validate: Whether to validate responses against the models. Set to
+                False only for trusted servers: models are then built with
+                ``model_construct`` and the response must match the schema.
+                Defaults to True.
+            cache_max: Maximum number of characters kept in the in-memory LRU
+                cache. Cached characters are returned without any request;
+                set to 0 to disable it and always revalidate with the server.
+                The ``ETag`` store used for revalidation is separate, stays
+                active when this is 0 and holds up to DEFAULT_CACHE_MAX
+                entries. Defaults to DEFAULT_CACHE_MAX.
+            client: An existing HTTP client to send requests with, such as the
+                one returned by get_default_client(). It is not closed by this
+                client, and timeout, http2 and limits are ignored. Defaults to
+                a new client owned by this instance.
+            max_attempts: Maximum number of attempts per request. Transient
+                errors (RETRY_EXCEPTIONS) and RETRY_STATUS_CODES responses are
+                retried with exponential backoff and jitter, honouring
+                ``Retry-After`` and ``X-RateLimit-Reset``. Defaults to 5.
         """
         self._base_url = base_url
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._character_url = f"{base_url}/character/"
+        self._validate = validate
+        self._max_attempts = max_attempts
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(timeout=timeout, http2=http2, limits=limits)
+        self._client = client
+        self._etag_cache: OrderedDict[int, tuple[str, Character]] = OrderedDict()
+        self._cache: OrderedDict[int, Character] = OrderedDict()
+        self._cache_max = cache_max
 
     async def get_character(self, character_id: int) -> Character:
         """Get a character by ID.
 
+        Characters in the in-memory cache are returned without a request.
+        Otherwise, characters previously returned with an ``ETag`` are
+        revalidated with ``If-None-Match``; a ``304 Not Modified`` answer
+        reuses the cached model without downloading or validating the body
+        again.
+
         Args:
             character_id: The ID of the character to retrieve.
 
@@ -38,15 +314,222 @@ class RickAndMortyClient:
             httpx.HTTPStatusError: If the API returns an error status code.
             httpx.RequestError: If the request fails.
         """
-        url = f"{self._base_url}/character/{character_id}"
-        response = await self._client.get(url)
-        response.raise_for_status()
-        json_data: dict[str, Any] = response.json()  # type: ignore[explicit-any]
-        return Character.model_validate(json_data)
+        character = self._cache_get(character_id)
+        if character is not None:
+            return character
+        cached = self._etag_cache.get(character_id)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        url = f"{self._character_url}{character_id}"
+        response = await self._get(url, headers=headers)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self._etag_cache.move_to_end(character_id)
+            self._cache_put(cached[1])
+            return cached[1]
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        character = self._decode_character(response.content)
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            self._etag_cache[character_id] = (etag, character)
+            self._etag_cache.move_to_end(character_id)
+            if len(self._etag_cache) > DEFAULT_CACHE_MAX:
+                self._etag_cache.popitem(last=False)
+        self._cache_put(character)
+        return character
+
+    async def get_characters(self, ids: Sequence[int]) -> list[Character]:
+        """Get several characters in a single request.
+
+        Uses the API's multiple-character endpoint (``/character/1,2,3``), so
+        fetching N characters costs one round trip instead of N. Only IDs
+        missing from the in-memory cache are requested.
+
+        Args:
+            ids: The IDs of the characters to retrieve.
+
+        Returns:
+            A list of Character model instances. IDs unknown to the API are
+            omitted from the result.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status code.
+            httpx.RequestError: If the request fails.
+        """
+        found: dict[int, Character] = {}
+        missing: list[int] = []
+        for character_id in ids:
+            character = self._cache_get(character_id)
+            if character is None:
+                missing.append(character_id)
+            else:
+                found[character_id] = character
+        if missing:
+            for character in await self._fetch_characters(missing):
+                found[character.id] = character
+                self._cache_put(character)
+        return [found[character_id] for character_id in ids if character_id in found]
+
+    async def get_many(
+        self,
+        ids: Iterable[int],
+        concurrency: int = 32,
+    ) -> list[Character]:
+        """Get characters with one concurrent request per ID.
+
+        Prefer get_characters(), which needs a single round trip. Use this
+        when each ID must be fetched on its own, e.g. to benefit from ETag
+        revalidation. Keep ``concurrency`` at or below the pool's
+        ``max_connections``.
+
+        Args:
+            ids: The IDs of the characters to retrieve.
+            concurrency: Maximum number of requests in flight. Defaults to 32.
+
+        Returns:
+            A list of Character model instances, in the order of ``ids``.
+
+        Raises:
+            ValueError: If ``concurrency`` is lower than 1.
+            httpx.HTTPStatusError: If the API returns an error status code.
+            httpx.RequestError: If the request fails.
+        """
+        if concurrency < 1:
+            msg = "concurrency must be >= 1"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(character_id: int) -> Character:
+            async with semaphore:
+                return await self.get_character(character_id)
+
+        return list(await asyncio.gather(*(fetch_one(i) for i in ids)))
+
+    async def stream_characters(self, url: str) -> AsyncIterator[Character]:
+        """Stream the characters of a list response as they arrive.
+
+        Each character is decoded as soon as its JSON object is complete,
+        so callers can start working before the whole body is downloaded.
+        Opening the stream is retried like any other request; a failure
+        while the body is being read is not.
+        Works with the multiple-character endpoint (a JSON array), paginated
+        listings (objects under ``results``) and single-character URLs (a
+        bare object, yielded once the body is complete).
+
+        Args:
+            url: Absolute URL of the listing, e.g.
+                ``f"{BASE_URL}/character?page=2"``.
+
+        Yields:
+            Character model instances, in response order.
+
+        Raises:
+            ValueError: If the body is not well-formed JSON.
+            httpx.HTTPStatusError: If the API returns an error status code.
+            httpx.RequestError: If the request fails.
+        """
+        response = await self._get(url, stream=True)
+        try:
+            if not 200 <= response.status_code < 300:
+                response.raise_for_status()
+            splitter = _JSONObjectSplitter()
+            async for chunk in response.aiter_bytes():
+                for item in splitter.feed(chunk):
+                    character = self._decode_character(item)
+                    self._cache_put(character)
+                    yield character
+            document = splitter.bare_object
+            # An empty listing is a bare object too; only a character is kept.
+            if document is not None and "results" not in from_json(document):
+                character = self._decode_character(document)
+                self._cache_put(character)
+                yield character
+        finally:
+            await response.aclose()
+
+    async def _fetch_characters(self, ids: Sequence[int]) -> list[Character]:
+        """Request the given characters from the multiple-character endpoint."""
+        url = self._character_url + ",".join(map(str, ids))
+        response = await self._get(url)
+        if len(ids) == 1 and _is_character_not_found(response):
+            # Unknown IDs are left out of list responses; do the same when
+            # only one ID is requested and the API reports it as not found.
+            return []
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        if len(ids) == 1:
+            # A single ID returns a bare object instead of a list.
+            return [self._decode_character(response.content)]
+        return self._decode_characters(response.content)
+
+    async def _get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a GET request, retrying transient failures.
+
+        With ``stream=True`` only the response head is awaited; the caller
+        must close the returned response.
+        """
+        request = self._client.build_request("GET", url, headers=headers)
+        attempt = 1
+        while True:
+            response: httpx.Response | None
+            try:
+                response = await self._client.send(request, stream=stream)
+            except RETRY_EXCEPTIONS:
+                if attempt >= self._max_attempts:
+                    raise
+                response = None
+            else:
+                if (
+                    attempt >= self._max_attempts
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+                await response.aclose()
+            await asyncio.sleep(_retry_delay(attempt, response))
+            attempt += 1
+
+    def _decode_character(self, content: bytes) -> Character:
+        """Decode a single-character JSON document."""
+        if self._validate:
+            return Character.model_validate_json(content)
+        return Character.from_trusted(from_json(content))
+
+    def _decode_characters(self, content: bytes) -> list[Character]:
+        """Decode a character-list JSON document."""
+        if self._validate:
+            return CHARACTER_LIST_ADAPTER.validate_json(content)
+        return [Character.from_trusted(item) for item in from_json(content)]
+
+    def clear_cache(self) -> None:
+        """Drop every cached character and stored ETag."""
+        self._cache.clear()
+        self._etag_cache.clear()
+
+    def _cache_get(self, character_id: int) -> Character | None:
+        """Return a cached character, marking it as recently used."""
+        character = self._cache.get(character_id)
+        if character is not None:
+            self._cache.move_to_end(character_id)
+        return character
+
+    def _cache_put(self, character: Character) -> None:
+        """Cache a character, evicting the least recently used one if full."""
+        if self._cache_max <= 0:
+            return
+        self._cache[character.id] = character
+        self._cache.move_to_end(character.id)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was supplied by the caller."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> RickAndMortyClient:
         """Async context manager entry."""
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# API responses are read-only; stripping whitespace would only add a pass
+# over every string field.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class CharacterOrigin(BaseModel):
     """Model for character origin information."""
 
+    model_config = _MODEL_CONFIG
+
     name: str
-    url: HttpUrl
+    url: str
 
 
 class CharacterLocation(BaseModel):
     """Model for character location information."""
 
+    model_config = _MODEL_CONFIG
+
     name: str
-    url: HttpUrl
+    url: str
 
 
 class Character(BaseModel):
     """Model for a Rick and Morty character."""
 
+    model_config = _MODEL_CONFIG
+
     id: int
     name: str
     status: str
@@ -30,13 +42,27 @@ class Character(BaseModel):
     gender: str
     origin: CharacterOrigin
     location: CharacterLocation
-    image: HttpUrl
-    episode: list[HttpUrl] = Field(default_factory=list)
-    url: HttpUrl
+    image: str
+    episode: list[str] = Field(default_factory=list)  # Episode URLs
+    url: str
     created: str  # ISO datetime string
 
-    class Config:
-        """Pydantic configuration."""
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Character:
+        """Build a character from trusted data without validating it.
+
+        Nested origin and location models are constructed the same way.
+        ``data`` must already match the schema; nothing is checked.
+        """
+        return cls.model_construct(
+            **{
+                **data,
+                "origin": CharacterOrigin.model_construct(**data["origin"]),
+                "location": CharacterLocation.model_construct(**data["location"]),
+            },
+        )
+
 
-        frozen = True
-        str_strip_whitespace = True
+# Built once at import time: constructing a TypeAdapter compiles its schema.
+CHARACTER_ADAPTER = TypeAdapter(Character)
+CHARACTER_LIST_ADAPTER = TypeAdapter(list[Character])
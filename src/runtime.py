@@ -0,0 +1,33 @@
+"""Runtime helpers for applications using the Rick and Morty client."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop when it is available.
+
+    Call it once from the application entry point, before ``asyncio.run``.
+    The client never calls it on its own: choosing the event loop is up to
+    the application.
+
+    Event loop policies are deprecated from Python 3.14, so nothing is
+    installed there; pass ``loop_factory=uvloop.new_event_loop`` to
+    ``asyncio.run`` instead.
+
+    Returns:
+        True if uvloop was installed, False if it is unavailable (on Windows,
+        on Python 3.14 or later, or when the ``uvloop`` package is not
+        installed).
+    """
+    if sys.platform == "win32" or sys.version_info >= (3, 14):
+        return False
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,13 +1,47 @@
 """Pytest configuration and fixtures."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
+import pytest_asyncio
 import respx
 
+from src.client import RickAndMortyClient
+
 
 @pytest.fixture
 def respx_mock() -> Generator[respx.MockRouter, None, None]:
-    """Fixture to provide a respx mock router for each test."""
-    with respx.mock() as respx_mock_router:
+    """Fixture to provide a respx mock router for each test.
+
+    Unmocked requests fail, but unused routes do not: tests assert on the
+    routes they care about.
+    """
+    with respx.mock(
+        assert_all_called=False,
+        assert_all_mocked=True,
+    ) as respx_mock_router:
         yield respx_mock_router
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture to skip the backoff wait between retried requests."""
+    monkeypatch.setattr("src.client._retry_delay", lambda *_: 0.0)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client() -> AsyncGenerator[RickAndMortyClient, None]:
+    """Fixture to provide one client, and its connection pool, per session."""
+    async with RickAndMortyClient() as client:
+        yield client
+
+
+@pytest.fixture
+def client(session_client: RickAndMortyClient) -> RickAndMortyClient:
+    """Fixture to provide the session client with empty caches.
+
+    Tests using it must run on the session loop:
+    ``@pytest.mark.asyncio(loop_scope="session")``.
+    """
+    session_client.clear_cache()
+    return session_client
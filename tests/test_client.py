@@ -1,15 +1,32 @@
 """Tests for the Rick and Morty API client with mocked HTTP responses."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
 import httpx
 import pytest
 import respx
 
-from src.client import BASE_URL, RickAndMortyClient
+from src.client import (
+    _DEFAULT_CLIENTS,
+    BASE_URL,
+    RickAndMortyClient,
+    _JSONObjectSplitter,
+    _retry_delay,
+    _server_retry_delay,
+    close_default_client,
+    get_default_client,
+    response_text,
+)
 from src.models import Character
 
 
-@pytest.mark.asyncio
-async def test_get_character_success(respx_mock: respx.MockRouter) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_success(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
     """Test successful character retrieval with mocked API response."""
     character_id = 1
     url = f"{BASE_URL}/character/{character_id}"
@@ -43,8 +60,7 @@ async def test_get_character_success(respx_mock: respx.MockRouter) -> None:
         return_value=httpx.Response(status_code=200, json=fake_response),
     )
 
-    async with RickAndMortyClient() as client:
-        character = await client.get_character(character_id)
+    character = await client.get_character(character_id)
 
     assert route.called, "Expected the HTTP request to be made"
     assert isinstance(character, Character)
@@ -57,8 +73,11 @@ async def test_get_character_success(respx_mock: respx.MockRouter) -> None:
     assert len(character.episode) == 2
 
 
-@pytest.mark.asyncio
-async def test_get_character_not_found(respx_mock: respx.MockRouter) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_not_found(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
     """Test handling of 404 error when character is not found."""
     character_id = 9999
     url = f"{BASE_URL}/character/{character_id}"
@@ -70,17 +89,19 @@ async def test_get_character_not_found(respx_mock: respx.MockRouter) -> None:
         ),
     )
 
-    async with RickAndMortyClient() as client:
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.get_character(character_id)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_character(character_id)
 
-        assert exc_info.value.response.status_code == 404
+    assert exc_info.value.response.status_code == 404
 
     assert route.called, "Expected the HTTP request to be made"
 
 
-@pytest.mark.asyncio
-async def test_get_character_server_error(respx_mock: respx.MockRouter) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_server_error(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
     """Test handling of 500 server error."""
     character_id = 1
     url = f"{BASE_URL}/character/{character_id}"
@@ -92,13 +113,12 @@ async def test_get_character_server_error(respx_mock: respx.MockRouter) -> None:
         ),
     )
 
-    async with RickAndMortyClient() as client:
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await client.get_character(character_id)
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_character(character_id)
 
-        assert exc_info.value.response.status_code == 500
+    assert exc_info.value.response.status_code == 500
 
-    assert route.called, "Expected the HTTP request to be made"
+    assert route.call_count == 5, "Expected the request to be retried"
 
 
 @pytest.mark.asyncio
@@ -147,3 +167,579 @@ async def test_client_context_manager() -> None:
     # Note: httpx client doesn't expose is_closed directly, but we can verify
     # by checking that operations fail after close
     assert True  # Context manager exit should complete without error
+
+
+def _fake_character(character_id: int, name: str) -> dict[str, object]:
+    """Build a minimal but valid character payload."""
+    return {
+        "id": character_id,
+        "name": name,
+        "status": "Alive",
+        "species": "Human",
+        "type": "",
+        "gender": "Male",
+        "origin": {"name": "Earth", "url": f"{BASE_URL}/location/1"},
+        "location": {"name": "Earth", "url": f"{BASE_URL}/location/1"},
+        "image": f"{BASE_URL}/character/avatar/{character_id}.jpeg",
+        "episode": [f"{BASE_URL}/episode/1"],
+        "url": f"{BASE_URL}/character/{character_id}",
+        "created": "2017-11-04T18:48:46.250Z",
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_batch(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that several characters are fetched in a single request."""
+    route = respx_mock.get(f"{BASE_URL}/character/1,2").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=[
+                _fake_character(1, "Rick Sanchez"),
+                _fake_character(2, "Morty Smith"),
+            ],
+        ),
+    )
+
+    characters = await client.get_characters([1, 2])
+
+    assert route.call_count == 1
+    assert [character.name for character in characters] == [
+        "Rick Sanchez",
+        "Morty Smith",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_single_id(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a single-ID batch handles the API's bare-object response."""
+    respx_mock.get(f"{BASE_URL}/character/1").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=_fake_character(1, "Rick Sanchez"),
+        ),
+    )
+    respx_mock.get(f"{BASE_URL}/character/9999").mock(
+        return_value=httpx.Response(
+            status_code=404,
+            json={"error": "Character not found"},
+        ),
+    )
+
+    characters = await client.get_characters([1])
+
+    assert [character.name for character in characters] == ["Rick Sanchez"]
+    assert await client.get_characters([9999]) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_single_id_other_404(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a 404 without the API's not-found body is still raised."""
+    respx_mock.get(f"{BASE_URL}/character/1").mock(
+        return_value=httpx.Response(status_code=404, text="Not Found"),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_characters([1])
+
+    assert exc_info.value.response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_empty(client: RickAndMortyClient) -> None:
+    """Test that an empty ID list returns without making a request."""
+    assert await client.get_characters([]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_character_etag_revalidation(respx_mock: respx.MockRouter) -> None:
+    """Test that a 304 answer to If-None-Match reuses the cached character."""
+    route = respx_mock.get(f"{BASE_URL}/character/1").mock(
+        side_effect=[
+            httpx.Response(
+                status_code=200,
+                json=_fake_character(1, "Rick Sanchez"),
+                headers={"ETag": 'W/"abc"'},
+            ),
+            httpx.Response(status_code=304),
+        ],
+    )
+
+    async with RickAndMortyClient(cache_max=0) as client:
+        first = await client.get_character(1)
+        second = await client.get_character(1)
+
+    assert route.call_count == 2
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == 'W/"abc"'
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_get_character_etag_store_is_bounded(
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the ETag store evicts entries beyond DEFAULT_CACHE_MAX."""
+    monkeypatch.setattr("src.client.DEFAULT_CACHE_MAX", 1)
+    routes = {
+        character_id: respx_mock.get(f"{BASE_URL}/character/{character_id}").mock(
+            return_value=httpx.Response(
+                status_code=200,
+                json=_fake_character(character_id, f"Character {character_id}"),
+                headers={"ETag": f'W/"{character_id}"'},
+            ),
+        )
+        for character_id in (1, 2)
+    }
+
+    async with RickAndMortyClient(cache_max=0) as client:
+        await client.get_character(1)
+        await client.get_character(2)
+        await client.get_character(1)
+        await client.get_character(2)
+
+    assert "If-None-Match" not in routes[1].calls[1].request.headers
+    assert "If-None-Match" not in routes[2].calls[1].request.headers
+
+
+@pytest.mark.asyncio
+async def test_get_characters_without_validation(
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that trusted mode builds nested models without validating."""
+    respx_mock.get(f"{BASE_URL}/character/1,2").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=[
+                _fake_character(1, "Rick Sanchez"),
+                _fake_character(2, "Morty Smith"),
+            ],
+        ),
+    )
+
+    async with RickAndMortyClient(validate=False) as client:
+        characters = await client.get_characters([1, 2])
+
+    assert all(isinstance(character, Character) for character in characters)
+    assert characters[1].name == "Morty Smith"
+    assert characters[1].origin.name == "Earth"
+    assert characters[1].episode == [f"{BASE_URL}/episode/1"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_omits_unknown_id_with_warm_cache(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that unknown IDs are omitted whatever is already cached."""
+    respx_mock.get(f"{BASE_URL}/character/1,9999").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=[_fake_character(1, "Rick Sanchez")],
+        ),
+    )
+    single_route = respx_mock.get(f"{BASE_URL}/character/9999").mock(
+        return_value=httpx.Response(
+            status_code=404,
+            json={"error": "Character not found"},
+        ),
+    )
+
+    cold = await client.get_characters([1, 9999])
+    warm = await client.get_characters([1, 9999])
+
+    assert [character.id for character in cold] == [1]
+    assert [character.id for character in warm] == [1]
+    assert single_route.call_count == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_uses_memory_cache(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that cached characters are returned without another request."""
+    route = respx_mock.get(f"{BASE_URL}/character/1").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=_fake_character(1, "Rick Sanchez"),
+        ),
+    )
+
+    first = await client.get_character(1)
+    second = await client.get_character(1)
+    client.clear_cache()
+    await client.get_character(1)
+
+    assert second is first
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_characters_requests_only_cache_misses(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that batched fetches skip IDs already in the cache."""
+    respx_mock.get(f"{BASE_URL}/character/1").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=_fake_character(1, "Rick Sanchez"),
+        ),
+    )
+    batch_route = respx_mock.get(f"{BASE_URL}/character/3,2").mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=[
+                _fake_character(2, "Morty Smith"),
+                _fake_character(3, "Summer Smith"),
+            ],
+        ),
+    )
+
+    await client.get_character(1)
+    characters = await client.get_characters([3, 1, 2])
+
+    assert batch_route.call_count == 1
+    assert [character.id for character in characters] == [3, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_not_closed() -> None:
+    """Test that a supplied HTTP client is shared and left open on exit."""
+    shared = get_default_client()
+    assert get_default_client() is shared
+
+    async with RickAndMortyClient(client=shared) as client:
+        assert client._client is shared
+
+    assert shared.is_closed is False
+    await close_default_client()
+    assert shared.is_closed is True
+
+
+@pytest.mark.asyncio
+async def test_default_client_drops_closed_loops() -> None:
+    """Test that shared clients of closed event loops are not kept forever."""
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    _DEFAULT_CLIENTS[closed_loop] = httpx.AsyncClient()
+
+    get_default_client()
+
+    assert closed_loop not in _DEFAULT_CLIENTS
+    await close_default_client()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_many(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that get_many fetches every ID and keeps the input order."""
+    for character_id, name in [(1, "Rick Sanchez"), (2, "Morty Smith")]:
+        respx_mock.get(f"{BASE_URL}/character/{character_id}").mock(
+            return_value=httpx.Response(
+                status_code=200,
+                json=_fake_character(character_id, name),
+            ),
+        )
+
+    characters = await client.get_many([2, 1], concurrency=1)
+
+    assert [character.name for character in characters] == [
+        "Morty Smith",
+        "Rick Sanchez",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_many_bounds_concurrency(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that no more than ``concurrency`` requests are ever in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def respond(
+        request: httpx.Request,  # noqa: ARG001
+        character_id: str,
+    ) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(
+            status_code=200,
+            json=_fake_character(int(character_id), "Clone"),
+        )
+
+    respx_mock.get(url__regex=rf"{BASE_URL}/character/(?P<character_id>\d+)").mock(
+        side_effect=respond,
+    )
+
+    characters = await client.get_many(range(1, 11), concurrency=3)
+
+    assert [character.id for character in characters] == list(range(1, 11))
+    assert peak == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_get_many_rejects_invalid_concurrency(
+    client: RickAndMortyClient,
+    concurrency: int,
+) -> None:
+    """Test that a concurrency below 1 is rejected instead of hanging."""
+    with pytest.raises(ValueError, match="concurrency must be >= 1"):
+        await client.get_many([1], concurrency=concurrency)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_retries_transient_errors(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that transport errors and 503 responses are retried."""
+    route = respx_mock.get(f"{BASE_URL}/character/1").mock(
+        side_effect=[
+            httpx.ConnectError("Connection refused"),
+            httpx.Response(status_code=503),
+            httpx.Response(status_code=200, json=_fake_character(1, "Rick")),
+        ],
+    )
+
+    character = await client.get_character(1)
+
+    assert route.call_count == 3
+    assert character.name == "Rick"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_character_does_not_retry_permanent_errors(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that transport errors which cannot succeed are raised at once."""
+    route = respx_mock.get(f"{BASE_URL}/character/1").mock(
+        side_effect=httpx.UnsupportedProtocol(
+            "Request URL has an unsupported protocol"
+        ),
+    )
+
+    with pytest.raises(httpx.UnsupportedProtocol):
+        await client.get_character(1)
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_character_retry_limit(respx_mock: respx.MockRouter) -> None:
+    """Test that max_attempts bounds the number of requests."""
+    route = respx_mock.get(f"{BASE_URL}/character/1").mock(
+        return_value=httpx.Response(status_code=429),
+    )
+
+    async with RickAndMortyClient(max_attempts=2) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_character(1)
+
+    assert route.call_count == 2
+
+
+def test_server_retry_delay_headers() -> None:
+    """Test parsing of server-provided backoff headers."""
+    assert _server_retry_delay(httpx.Headers({"Retry-After": "3"})) == 3.0
+    for past_headers in [
+        {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        {"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"},  # Naive datetime
+        {"X-RateLimit-Reset": "0"},
+    ]:
+        delay = _server_retry_delay(httpx.Headers(past_headers))
+        assert delay is not None
+        assert delay < 0
+    assert _server_retry_delay(httpx.Headers({"Retry-After": "soon"})) is None
+    assert _server_retry_delay(httpx.Headers()) is None
+
+
+def test_retry_delay_backoff_with_jitter() -> None:
+    """Test that the backoff stays within its exponential, capped ceiling."""
+    for attempt, ceiling in [(1, 0.2), (3, 0.8), (10, 10.0)]:
+        delays = [_retry_delay(attempt, None) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert len(set(delays)) > 1, "Expected jittered delays"
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"Retry-After": "3"}, 3.0),
+        ({"Retry-After": "Wed, 21 Oct 2099 07:28:00 GMT"}, 60.0),
+        ({"Retry-After": "86400"}, 60.0),
+    ],
+)
+def test_retry_delay_honours_server_delay(
+    headers: dict[str, str],
+    expected: float,
+) -> None:
+    """Test that positive server delays are used, capped at 60 seconds."""
+    response = httpx.Response(status_code=429, headers=headers)
+
+    assert _retry_delay(1, response) == expected
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Retry-After": "0"},
+        {"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"},
+        {"X-RateLimit-Reset": "30"},  # Seconds until reset, not an epoch
+    ],
+)
+def test_retry_delay_falls_back_to_backoff(headers: dict[str, str]) -> None:
+    """Test that zero or past server delays still back off exponentially."""
+    response = httpx.Response(status_code=429, headers=headers)
+    delays = [_retry_delay(3, response) for _ in range(200)]
+
+    assert all(0 <= delay <= 0.8 for delay in delays)
+    assert len(set(delays)) > 1, "Expected jittered delays"
+
+
+def test_json_object_splitter_across_chunks() -> None:
+    """Test that objects are emitted whole whatever the chunk boundaries."""
+    body = json.dumps(
+        {
+            "info": {"count": 2, "next": None},
+            "results": [
+                {"name": 'tricky "}]" \\', "episode": ["a", "b"]},
+                {"name": "plain", "origin": {"name": "Earth"}},
+            ],
+        },
+    ).encode()
+    splitter = _JSONObjectSplitter()
+
+    items = [
+        item
+        for index in range(len(body))
+        for item in splitter.feed(body[index : index + 1])
+    ]
+
+    assert [json.loads(item)["name"] for item in items] == ['tricky "}]" \\', "plain"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_characters(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that characters are yielded from a streamed list response."""
+    body = json.dumps(
+        [_fake_character(1, "Rick Sanchez"), _fake_character(2, "Morty Smith")],
+    ).encode()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for index in range(0, len(body), 64):
+            yield body[index : index + 64]
+
+    url = f"{BASE_URL}/character/1,2"
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(status_code=200, content=chunks()),
+    )
+
+    names = [character.name async for character in client.stream_characters(url)]
+
+    assert names == ["Rick Sanchez", "Morty Smith"]
+
+
+@pytest.mark.asyncio
+async def test_response_text() -> None:
+    """Test that response bodies are decoded to text off the event loop."""
+    response = httpx.Response(
+        status_code=404,
+        content="Personaje no encontrado: ñ".encode(),
+        headers={"Content-Type": "text/plain; charset=utf-8"},
+    )
+
+    assert await response_text(response) == "Personaje no encontrado: ñ"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_characters_retries_opening_request(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a transient failure before the body arrives is retried."""
+    url = f"{BASE_URL}/character?page=1"
+    route = respx_mock.get(url).mock(
+        side_effect=[
+            httpx.ConnectError("Connection refused"),
+            httpx.Response(status_code=503),
+            httpx.Response(
+                status_code=200,
+                json={"info": {}, "results": [_fake_character(1, "Rick")]},
+            ),
+        ],
+    )
+
+    names = [character.name async for character in client.stream_characters(url)]
+
+    assert names == ["Rick"]
+    assert route.call_count == 3
+
+
+@pytest.mark.parametrize(
+    ("body", "cause"),
+    [(b"[{}]]", "unexpected"), (b'{"a": [}', "mismatched")],
+)
+def test_json_object_splitter_rejects_malformed_json(body: bytes, cause: str) -> None:
+    """Test that unbalanced brackets raise a ValueError naming the cause."""
+    with pytest.raises(ValueError, match=f"Malformed JSON: {cause}"):
+        _JSONObjectSplitter().feed(body)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_characters_single_character(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a single-character URL yields its bare object."""
+    url = f"{BASE_URL}/character/1"
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json=_fake_character(1, "Rick Sanchez"),
+        ),
+    )
+
+    names = [character.name async for character in client.stream_characters(url)]
+
+    assert names == ["Rick Sanchez"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_characters_empty_listing(
+    client: RickAndMortyClient,
+    respx_mock: respx.MockRouter,
+) -> None:
+    """Test that a listing without results yields nothing."""
+    url = f"{BASE_URL}/character?page=1"
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(
+            status_code=200,
+            json={"info": {"count": 0}, "results": []},
+        ),
+    )
+
+    assert [character async for character in client.stream_characters(url)] == []
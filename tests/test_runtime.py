@@ -0,0 +1,49 @@
+"""Tests for the runtime helpers."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from src.runtime import install_uvloop
+
+
+def test_install_uvloop_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing uvloop package is reported instead of raised."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert install_uvloop() is False
+
+
+def test_install_uvloop_skips_deprecated_policies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that no event loop policy is set on Python 3.14 or later."""
+    policies: list[object] = []
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.EventLoopPolicy = object  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+    monkeypatch.setattr(sys, "version_info", (3, 14, 0, "final", 0))
+
+    assert install_uvloop() is False
+    assert policies == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uvloop is not on Windows")
+def test_install_uvloop_sets_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that uvloop's event loop policy is installed when available."""
+    policies: list[object] = []
+
+    class _FakePolicy:
+        pass
+
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.EventLoopPolicy = _FakePolicy  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+    monkeypatch.setattr(sys, "version_info", (3, 13, 0, "final", 0))
+
+    assert install_uvloop() is True
+    assert isinstance(policies[0], _FakePolicy)